@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# src layout: make the package importable without installation.
+sys.path.insert(0, str(Path(__file__).parent / "src"))
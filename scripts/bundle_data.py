@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+"""Pre-build the combined game data snapshot.
+
+Runs every loader once with the snapshot cache enabled, so the first
+real process start restores one pickle blob instead of opening and
+parsing the seventeen JSON files. Safe to re-run; the snapshot file is
+keyed by a hash of the data bytes and rewrites only when stale.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+os.environ["DJ_ENGINE_CACHE"] = "1"
+
+from dj_engine.data_loader import _snapshot_file, load_all_data  # noqa: E402
+
+
+def main() -> None:
+    load_all_data()
+    print(f"Snapshot ready: {_snapshot_file()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Worker placement actions and the dispatch table."""
+
+from collections.abc import Callable
+from typing import Any
+
+from ..constants import ActionType
+from .academy import perform_academy_action
+from .reserve_turn_order import perform_reserve_turn_order
+
+# O(1) dispatch for orchestrators, instead of branching per action type.
+ACTION_TABLE: dict[ActionType, Callable[..., Any]] = {
+    ActionType.ACADEMY: perform_academy_action,
+    ActionType.RESERVE_TURN_ORDER: perform_reserve_turn_order,
+}
+
+__all__ = [
+    "ACTION_TABLE",
+    "perform_academy_action",
+    "perform_reserve_turn_order",
+]
@@ -0,0 +1,195 @@
+"""The ACADEMY worker placement action."""
+
+import logging
+
+from ..constants import ACADEMY_COLS, ACADEMY_ROWS, VALID_ACADEMY_MASK, ActionType
+from ..data_loader import AllGameData
+from ..engine_utils import (
+    calculate_placement_penalty,
+    check_wax_seal_req,
+    resolve_player_and_worker,
+    spend_coins,
+    spend_temp_knowledge,
+)
+from ..exceptions import GameError, InvalidActionError
+from ..state import SEAL_SLOT_SHIFT, WORKER_PLACED_BIT, GameState
+
+logger = logging.getLogger(__name__)
+
+
+def _academy_total_cost(
+    scroll_cost: int, slot_cost: int, penalty: int, knowledge_spent: int
+) -> int:
+    """Numeric core of the academy cost computation (clamped at zero)."""
+    total = scroll_cost + slot_cost + penalty - knowledge_spent
+    return total if total > 0 else 0
+
+
+try:  # Compile the numeric helper when numba is available.
+    from numba import njit
+
+    _academy_total_cost = njit(cache=True)(_academy_total_cost)
+    # Pre-warm so the first simulated action does not pay the compile.
+    _academy_total_cost(0, 0, 0, 0)
+except ImportError:
+    pass
+
+
+def perform_academy_action(
+    game_state: GameState,
+    all_game_data: AllGameData,
+    player_index: int,
+    worker_id: int,
+    location_id: str,
+    chosen_scroll_row: int,
+    chosen_seal_index: int,
+    temp_knowledge_spent: int = 0,
+) -> None:
+    """Place a worker on an Academy location and take one academy seal.
+
+    The player pays the scroll cost (row 1 is free, deeper rows cost
+    more) plus any placement penalty, then takes the seal at
+    ``(chosen_scroll_row, chosen_seal_index)`` onto the worker's next
+    free seal slot.
+    """
+    logger.info(
+        "Player %d attempts ACADEMY at %s with worker %d (row %d, seal %d)",
+        player_index,
+        location_id,
+        worker_id,
+        chosen_scroll_row,
+        chosen_seal_index,
+    )
+    player_state, worker = resolve_player_and_worker(
+        game_state, player_index, worker_id
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Worker %d seals: %s", worker_id, worker.seals)
+
+    if location_id not in all_game_data.main_board_actions:
+        raise InvalidActionError(f"Unknown location {location_id}")
+    location_data = all_game_data.main_board_actions[location_id]
+    if location_data.action_type != ActionType.ACADEMY.value:
+        raise InvalidActionError(f"{location_id} is not an Academy location")
+    logger.info("Resolved location %s (%s)", location_id, location_data.diary_type)
+
+    if not check_wax_seal_req(
+        player_state, worker, location_data.wax_seal_requirements
+    ):
+        raise InvalidActionError(
+            f"Worker {worker_id} does not meet the wax seal requirements "
+            f"{location_data.wax_seal_requirements}"
+        )
+
+    # Bind the attribute chains once; everything below uses the locals.
+    personal_board_def = all_game_data.personal_board
+    if personal_board_def is None:
+        raise GameError("Personal board definition not loaded")
+    worker_row_def = personal_board_def._rows_by_index.get(worker.row_index)
+    if worker_row_def is None:
+        raise GameError(f"No worker row definition for row {worker.row_index}")
+    slots_filled = (worker.state >> SEAL_SLOT_SHIFT) & 0b111
+    if slots_filled >= worker_row_def.max_seals:
+        raise InvalidActionError(
+            f"Worker {worker_id} has no free seal slots "
+            f"({slots_filled}/{worker_row_def.max_seals})"
+        )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Worker row %d: %d of %d seal slots used",
+            worker.row_index,
+            slots_filled,
+            worker_row_def.max_seals,
+        )
+
+    # One bitmap probe validates the (row, seal) pair; the seal index
+    # bound keeps out-of-row columns from aliasing into a valid bit.
+    seal_pos = (chosen_scroll_row - 1) * ACADEMY_COLS + chosen_seal_index
+    if not (
+        0 <= chosen_seal_index < ACADEMY_COLS
+        and 0 <= seal_pos < ACADEMY_ROWS * ACADEMY_COLS
+        and (VALID_ACADEMY_MASK >> seal_pos) & 1
+    ):
+        raise InvalidActionError(
+            f"Invalid academy position (row {chosen_scroll_row}, "
+            f"seal {chosen_seal_index})"
+        )
+
+    scrolls = all_game_data.academy_scrolls
+    if chosen_scroll_row not in scrolls:
+        raise GameError(f"No academy scroll data for row {chosen_scroll_row}")
+    scroll_data = scrolls[chosen_scroll_row]
+    logger.info("Scroll row %d costs %d", chosen_scroll_row, scroll_data.cost)
+
+    # seal_pos was validated against the bitmap above; index directly.
+    seal_to_take = game_state.academy_seals[seal_pos]
+    if seal_to_take is None:
+        raise InvalidActionError(
+            f"No seal left at academy position ({chosen_scroll_row}, "
+            f"{chosen_seal_index})"
+        )
+    logger.info("Seal available at position %d: %s", seal_pos, seal_to_take)
+
+    # max_seals may exceed the defined seal_slots (worker row 0 ships
+    # with one seal but an empty slot list), so bound-check the slot.
+    if slots_filled >= len(worker_row_def.seal_slots):
+        raise InvalidActionError(
+            f"Worker row {worker.row_index} has no seal slot {slots_filled}"
+        )
+    seal_slot_def = worker_row_def.seal_slots[slots_filled]
+
+    penalty = calculate_placement_penalty(game_state, location_data)
+    logger.info("Placement penalty at %s: %d", location_id, penalty)
+
+    if temp_knowledge_spent:
+        if player_state.temporary_knowledge < temp_knowledge_spent:
+            raise InvalidActionError(
+                f"Player {player_index} has only "
+                f"{player_state.temporary_knowledge} temporary knowledge"
+            )
+    total_cost = _academy_total_cost(
+        scroll_data.cost,
+        seal_slot_def.placement_cost,
+        penalty,
+        temp_knowledge_spent,
+    )
+    logger.info(
+        "Total academy cost for player %d: %d (scroll %d, slot %d, penalty %d, "
+        "knowledge -%d)",
+        player_index,
+        total_cost,
+        scroll_data.cost,
+        seal_slot_def.placement_cost,
+        penalty,
+        temp_knowledge_spent,
+    )
+    # Inlined engine_utils.can_afford: it is a bare int compare today.
+    if player_state.coins < total_cost:
+        raise InvalidActionError(
+            f"Player {player_index} cannot afford {total_cost} coins"
+        )
+
+    # All checks passed: mutate state.
+    if temp_knowledge_spent:
+        spend_temp_knowledge(player_state, temp_knowledge_spent)
+    spend_coins(player_state, total_cost)
+    game_state.academy_seals[seal_pos] = None
+    worker.seals[seal_to_take] += 1
+    worker.state += 1 << SEAL_SLOT_SHIFT
+    worker.state |= WORKER_PLACED_BIT
+    game_state.main_board_workers[location_id].append(
+        (player_index, worker_id)
+    )
+    logger.info(
+        "Player %d took a %s seal with worker %d",
+        player_index,
+        seal_to_take.name,
+        worker_id,
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Worker %d seals now %s; academy display %s",
+            worker_id,
+            worker.seals,
+            game_state.academy_seals,
+        )
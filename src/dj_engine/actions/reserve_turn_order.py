@@ -0,0 +1,81 @@
+"""The RESERVE_TURN_ORDER worker placement action."""
+
+import logging
+
+from ..constants import ActionType
+from ..data_loader import AllGameData
+from ..engine_utils import (
+    calculate_placement_penalty,
+    gain_coins,
+    resolve_player_and_worker,
+    spend_coins,
+)
+from ..exceptions import InvalidActionError
+from ..state import WORKER_PLACED_BIT, GameState
+
+logger = logging.getLogger(__name__)
+
+RESERVE_LOCATION_ID = "RESERVE_TURN_ORDER"
+
+
+def perform_reserve_turn_order(
+    game_state: GameState,
+    all_game_data: AllGameData,
+    player_index: int,
+    worker_id: int,
+) -> None:
+    """Place a worker on the turn order track and gain the coin reward.
+
+    Turn order positions are claimed in placement order; the worker
+    placed first reserves the first seat for the next round.
+    """
+    logger.info(
+        "Player %d attempts RESERVE_TURN_ORDER with worker %d",
+        player_index,
+        worker_id,
+    )
+    player_state, worker = resolve_player_and_worker(
+        game_state, player_index, worker_id
+    )
+
+    if RESERVE_LOCATION_ID not in all_game_data.main_board_actions:
+        raise InvalidActionError(f"Unknown location {RESERVE_LOCATION_ID}")
+    location_data = all_game_data.main_board_actions[RESERVE_LOCATION_ID]
+    if location_data.action_type != ActionType.RESERVE_TURN_ORDER.value:
+        raise InvalidActionError(
+            f"{RESERVE_LOCATION_ID} is not a turn order location"
+        )
+    if player_index in game_state.reserved_turn_order:
+        raise InvalidActionError(
+            f"Player {player_index} already reserved a turn order position"
+        )
+
+    penalty = calculate_placement_penalty(game_state, location_data)
+    # Inlined engine_utils.can_afford: it is a bare int compare today.
+    if player_state.coins < penalty:
+        raise InvalidActionError(
+            f"Player {player_index} cannot afford the placement penalty {penalty}"
+        )
+
+    # All checks passed: mutate state.
+    spend_coins(player_state, penalty)
+    position = len(game_state.reserved_turn_order)
+    game_state.reserved_turn_order[player_index] = position
+    for action_info in location_data.base_actions:
+        if action_info.type == ActionType.GAIN_COINS.value and action_info.value:
+            gain_coins(player_state, action_info.value)
+            logger.info(
+                "Player %d gains %d coins for reserving turn order",
+                player_index,
+                action_info.value,
+            )
+    worker.state |= WORKER_PLACED_BIT
+    game_state.main_board_workers[RESERVE_LOCATION_ID].append(
+        (player_index, worker_id)
+    )
+    logger.info(
+        "Player %d reserved turn order position %d with worker %d",
+        player_index,
+        position,
+        worker_id,
+    )
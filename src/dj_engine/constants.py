@@ -0,0 +1,136 @@
+"""Shared enums and board constants for the Darwin's Journey engine."""
+
+from enum import Enum, IntEnum
+
+
+class SealColor(IntEnum):
+    """Wax seal colours. PURPLE is the special wildcard seal.
+
+    Int-valued so seal dicts hash on small ints; the data loader maps the
+    JSON colour names via ``SealColor[name]`` at the boundary.
+    """
+
+    GREEN = 0
+    BLUE = 1
+    RED = 2
+    YELLOW = 3
+    PURPLE = 4
+
+
+class PlayerColor(IntEnum):
+    """Player piece colours."""
+
+    RED = 0
+    BLUE = 1
+    GREEN = 2
+    YELLOW = 3
+
+
+class SpecimenKind(str, Enum):
+    """Specimen token kinds (museum columns)."""
+
+    REPTILE = "REPTILE"
+    PLANT = "PLANT"
+    BIRD = "BIRD"
+    FOSSIL = "FOSSIL"
+
+
+class TrackType(str, Enum):
+    """Movement track identifiers, matching the strings used in the data files."""
+
+    OCEAN = "Ocean"
+    ISLAND_A = "Island A"
+    ISLAND_B = "Island B"
+    ISLAND_C = "Island C"
+
+
+class DistinctionType(str, Enum):
+    """Distinction levels granted by objectives."""
+
+    SILVER = "SILVER"
+    GOLDEN = "GOLDEN"
+
+
+class ObjectiveRequirementType(str, Enum):
+    """Requirement kinds appearing on objective tiles."""
+
+    HAVE_SEALS = "HAVE_SEALS"
+    HAVE_SPECIMEN_RESEARCHED = "HAVE_SPECIMEN_RESEARCHED"
+    HAVE_VP = "HAVE_VP"
+    HAVE_COINS = "HAVE_COINS"
+    HAVE_TEMP_KNOWLEDGE = "HAVE_TEMP_KNOWLEDGE"
+    HAVE_TENTS_PLACED = "HAVE_TENTS_PLACED"
+    HAVE_LENS_TOKENS_PLACED = "HAVE_LENS_TOKENS_PLACED"
+    EMPTY_STAMP_STACKS = "EMPTY_STAMP_STACKS"
+    SHIP_AT_BEAGLE_OR_AHEAD = "SHIP_AT_BEAGLE_OR_AHEAD"
+    SHIP_AT_LEAST_AT_POSITION = "SHIP_AT_LEAST_AT_POSITION"
+    THEORY_TRACK_AT_LEAST_AT_POSITION = "THEORY_TRACK_AT_LEAST_AT_POSITION"
+
+
+class ActionType(str, Enum):
+    """Every action keyword appearing in the data files.
+
+    Covers worker-placement actions, immediate rewards, distinction
+    bonuses and the passive objective-slot effects.
+    """
+
+    # Worker placement / main board
+    EXPLORE = "EXPLORE"
+    NAVIGATE = "NAVIGATE"
+    ACADEMY = "ACADEMY"
+    CORRESPONDENCE = "CORRESPONDENCE"
+    MUSEUM = "MUSEUM"
+    RESERVE_TURN_ORDER = "RESERVE_TURN_ORDER"
+    SPECIAL = "SPECIAL"
+    UNLOCK_LENS = "UNLOCK_LENS"
+    CAMP = "CAMP"
+    # Immediate / simple rewards
+    GAIN_COINS = "GAIN_COINS"
+    GAIN_VP = "GAIN_VP"
+    GAIN_TEMP_KNOWLEDGE = "GAIN_TEMP_KNOWLEDGE"
+    GAIN_OBJECTIVE = "GAIN_OBJECTIVE"
+    GAIN_SEAL_ANY_FREE = "GAIN_SEAL_ANY_FREE"
+    GAIN_SEAL_SPECIAL = "GAIN_SEAL_SPECIAL"
+    ADVANCE_THEORY = "ADVANCE_THEORY"
+    CHOICE = "CHOICE"
+    DELIVER_SPECIMEN = "DELIVER_SPECIMEN"
+    RESEARCH_MUSEUM = "RESEARCH_MUSEUM"
+    RESEARCH_ANY_SPECIMEN = "RESEARCH_ANY_SPECIMEN"
+    PLACE_EXPLORER = "PLACE_EXPLORER"
+    ESTABLISH_ANY_CAMPSITE = "ESTABLISH_ANY_CAMPSITE"
+    MOVE_TO_BEAGLE = "MOVE_TO_BEAGLE"
+    COPY_CREW_CARD = "COPY_CREW_CARD"
+    PERFORM_LOCKED_ACTION = "PERFORM_LOCKED_ACTION"
+    REPEAT_DELIVERY = "REPEAT_DELIVERY"
+    AUTO_FULFILL_OBJECTIVE = "AUTO_FULFILL_OBJECTIVE"
+    CORRESPONDENCE_DISTRIBUTED = "CORRESPONDENCE_DISTRIBUTED"
+    END_OF_ISLAND_BONUS = "END_OF_ISLAND_BONUS"
+    END_OF_OCEAN_BONUS = "END_OF_OCEAN_BONUS"
+    # Distinction bonuses
+    BONUS_EXPLORE = "BONUS_EXPLORE"
+    BONUS_NAVIGATE = "BONUS_NAVIGATE"
+    BONUS_MOVEMENT_STOP = "BONUS_MOVEMENT_STOP"
+    BONUS_ACADEMY_SEAL = "BONUS_ACADEMY_SEAL"
+    BONUS_ACADEMY_DISCOUNT = "BONUS_ACADEMY_DISCOUNT"
+    BONUS_CORRESPONDENCE_STAMP = "BONUS_CORRESPONDENCE_STAMP"
+    BONUS_CORRESPONDENCE_SPLIT = "BONUS_CORRESPONDENCE_SPLIT"
+    # Personal board objective-slot effects
+    OBJECTIVE_REACTIVATE_TENT = "OBJECTIVE_REACTIVATE_TENT"
+    OBJECTIVE_FREE_ACADEMY_SCROLL = "OBJECTIVE_FREE_ACADEMY_SCROLL"
+    OBJECTIVE_RESEARCH_ON_EXPLORER_ISLAND = "OBJECTIVE_RESEARCH_ON_EXPLORER_ISLAND"
+    OBJECTIVE_ADD_BOOK_MULTIPLIER = "OBJECTIVE_ADD_BOOK_MULTIPLIER"
+    OBJECTIVE_UNLOCK_WORKER_5 = "OBJECTIVE_UNLOCK_WORKER_5"
+    OBJECTIVE_GAIN_PURPLE_WAX_SEAL = "OBJECTIVE_GAIN_PURPLE_WAX_SEAL"
+    OBJECTIVE_REDUCE_DIARY_PENALTY = "OBJECTIVE_REDUCE_DIARY_PENALTY"
+    OBJECTIVE_MAX_LAG_PENALTY = "OBJECTIVE_MAX_LAG_PENALTY"
+
+
+# Academy board shape: scroll rows 1-4, three seal slots per row.
+ACADEMY_ROWS = 4
+ACADEMY_COLS = 3
+# Bitmap of valid flat academy positions (row * ACADEMY_COLS + col); the
+# full 4x3 grid is playable, so every bit is set.
+VALID_ACADEMY_MASK = (1 << (ACADEMY_ROWS * ACADEMY_COLS)) - 1
+
+# Workers every player starts with (the 5th row worker is unlocked later).
+STARTING_WORKERS = 4
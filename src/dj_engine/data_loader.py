@@ -0,0 +1,1536 @@
+"""Loaders for the static game data shipped under ``data/``.
+
+Each ``load_*`` function reads one JSON file and returns a dict of parsed
+dataclasses keyed by the natural id of the record.  ``load_all_data()``
+runs every loader and bundles the results into an :class:`AllGameData`.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import sys
+import threading
+from array import array
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from importlib import resources
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+try:  # orjson parses the data files noticeably faster when available.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the wheel
+    orjson = None
+
+try:  # cysimdjson tokenizes with SIMD and wins on the larger files.
+    import cysimdjson
+except ImportError:  # pragma: no cover - exercised only without the wheel
+    cysimdjson = None
+
+from .constants import (
+    ActionType,
+    ObjectiveRequirementType,
+    SealColor,
+    SpecimenKind,
+    TrackType,
+)
+
+logger = logging.getLogger(__name__)
+
+# The data files ship inside the package, so resource resolution works
+# from a wheel or zipapp as well as a source checkout.
+DATA_PATH = resources.files(__package__) / "data"
+
+# One parser per thread: JSONParser is not thread-safe and each parse()
+# reuses its internal document buffer, so sharing one instance across
+# the load_all_data() thread pool would corrupt concurrent exports.
+_SIMD_LOCAL = threading.local()
+
+
+def _simd_parser() -> "cysimdjson.JSONParser | None":
+    if cysimdjson is None:
+        return None
+    parser = getattr(_SIMD_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMD_LOCAL.parser = cysimdjson.JSONParser()
+    return parser
+
+
+@functools.cache
+def _raw_blobs() -> dict[str, "bytes | mmap.mmap"]:
+    """Map every data file into memory in one directory pass.
+
+    A single iterdir replaces the per-file exists()+open() stat pair.
+    Files on a real filesystem are mmap'd read-only, so the buffer is
+    backed by the OS page cache with no heap copy; zip/wheel resources
+    (or empty files, which mmap rejects) fall back to read_bytes().
+    """
+    blobs: dict[str, bytes | mmap.mmap] = {}
+    try:
+        for entry in DATA_PATH.iterdir():
+            if not (entry.is_file() and entry.name.endswith(".json")):
+                continue
+            try:
+                with open(str(entry), "rb") as f:
+                    blobs[entry.name] = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+            except (OSError, ValueError):
+                blobs[entry.name] = entry.read_bytes()
+    except OSError as e:
+        logger.error("Cannot read data directory %s: %s", DATA_PATH, e)
+    return blobs
+
+
+def _load_json(filename: str) -> Any:
+    """Parse one JSON file from the in-memory blob cache."""
+    blob = _raw_blobs().get(filename)
+    if blob is None:
+        logger.error("Data file not found: %s", DATA_PATH / filename)
+        return None
+    try:
+        parser = _simd_parser()
+        if parser is not None:
+            # export() materialises plain dict/list so the _parse_*
+            # helpers stay parser-agnostic.
+            return parser.parse(blob).export()
+        if orjson is not None:
+            # orjson takes any buffer via memoryview without copying.
+            return orjson.loads(
+                blob if isinstance(blob, bytes) else memoryview(blob)
+            )
+        return json.loads(blob if isinstance(blob, bytes) else bytes(blob))
+    except ValueError as e:  # covers json and orjson decode errors
+        logger.error("Failed to parse %s: %s", filename, e)
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Parsed record types
+# ---------------------------------------------------------------------------
+
+
+class SimpleActionInfo(NamedTuple):
+    """One action entry as it appears in the data files.
+
+    ``type`` is an :class:`ActionType` when the string is recognised,
+    otherwise the raw string is kept so unknown data is not dropped.
+    A NamedTuple rather than a dataclass: these are created in the
+    thousands and a tuple layout is the smallest per-record footprint.
+    """
+
+    type: ActionType | str
+    value: Any = None
+    timing: str | None = None
+    choice_source: str | None = None
+    options: "tuple[SimpleActionInfo, ...] | None" = None
+
+
+@dataclass(slots=True, frozen=True)
+class AcademyScroll:
+    id: str
+    scroll_row: int
+    cost: int
+    slots: int
+
+
+@dataclass(slots=True, frozen=True)
+class ScoringCondition:
+    type: str
+    color: str | None = None
+    kind: str | None = None
+    points_per: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class BeagleGoal:
+    goal_id: int
+    description: str
+    scoring_condition: ScoringCondition | None = None
+
+
+class TentSlotInfo(NamedTuple):
+    slot_index: int
+    placement_cost: int
+
+
+@dataclass(slots=True, frozen=True)
+class Campsite:
+    campsite_area_id: str
+    originating_track_space_id: str
+    track_type: TrackType
+    tent_slots: tuple[TentSlotInfo, ...] = ()
+    actions_on_placement: tuple[SimpleActionInfo, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class CorrespondenceTile:
+    tile_id: int
+    first_place_rewards: tuple[SimpleActionInfo, ...] = ()
+    second_place_rewards: tuple[SimpleActionInfo, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class CrewCard:
+    card_id: int
+    starting_seal_color: SealColor
+    activation_requirement: dict[SealColor, int] = field(default_factory=dict)
+    achieved_actions: tuple[SimpleActionInfo, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class DistinctionBonus:
+    type: str
+    value: Any = None
+
+
+@functools.lru_cache(maxsize=256)
+def _distinction_bonus(type_: str, value: Any) -> DistinctionBonus:
+    """Flyweight constructor: identical (type, value) pairs share one
+    frozen DistinctionBonus across all board locations."""
+    return DistinctionBonus(type_, value)
+
+
+@dataclass(slots=True, frozen=True)
+class TrackSpace:
+    id: str
+    silver_banner: bool = False
+    beagle_goal: bool = False
+    # Read-only once parsed; the empty defaults are shared tuples so
+    # constructing a bare space never calls a default factory.
+    actions: tuple[SimpleActionInfo, ...] = ()
+    has_specimen: bool = False
+    next: tuple[str, ...] | list[str] = ()
+    spawns_explorer_on_island: str | None = None
+    campsite_area_id: str | None = None
+    golden_ribbon_vp: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class BoardActionLocation:
+    location_id: str
+    diary_type: str
+    action_type: str
+    placement_type: str
+    locked: bool = False
+    unlock_cost: int | None = None
+    wax_seal_requirements: dict[SealColor, int] = field(default_factory=dict)
+    base_actions: tuple[SimpleActionInfo, ...] = ()
+    distinction_bonuses: dict[str, tuple[DistinctionBonus, ...]] = field(
+        default_factory=lambda: {"silver": (), "golden": ()}
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectiveDisplayComponent:
+    component_type: str
+    objective_type: str
+    count: int = 1
+    description: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectiveDisplayAreaInfo:
+    area_id: str
+    description: str | None = None
+    components: tuple[ObjectiveDisplayComponent, ...] = ()
+    is_worker_placement_location: bool = False
+
+
+class ObjectiveRequirement(NamedTuple):
+    type: ObjectiveRequirementType
+    color: SealColor | None = None
+    kind: SpecimenKind | SealColor | None = None
+    count: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectiveTile:
+    objective_id: int
+    type: str
+    requirements: tuple[ObjectiveRequirement, ...] = ()
+
+
+class PersonalBoardSealSlot(NamedTuple):
+    slot_index: int
+    placement_cost: int
+    distinction_trigger: str | None = None
+    reward_action: SimpleActionInfo | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PersonalBoardWorkerRow:
+    row_index: int
+    max_seals: int
+    has_starting_special_seal: bool = False
+    seal_slots: tuple[PersonalBoardSealSlot, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class PersonalBoardObjectiveSlot:
+    slot_id: str
+    type: str
+    position: int
+    placement_cost: int
+    reward_actions: tuple[SimpleActionInfo, ...] = ()
+
+
+class PersonalBoardTentSlot(NamedTuple):
+    slot_index: int
+    revealed_action: SimpleActionInfo | None = None
+
+
+class PersonalBoardStampSlot(NamedTuple):
+    slot_index: int
+    revealed_action: SimpleActionInfo | None = None
+
+
+class PersonalBoardSpecimenSlot(NamedTuple):
+    specimen_token_id: str
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectivePairBonus:
+    condition: tuple[str, ...] = ()
+    reward_action: SimpleActionInfo | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PersonalBoardDefinition:
+    board_id: str
+    worker_rows: tuple[PersonalBoardWorkerRow, ...] = ()
+    objective_slots: tuple[PersonalBoardObjectiveSlot, ...] = ()
+    objective_pair_bonus: ObjectivePairBonus | None = None
+    tent_slots: tuple[PersonalBoardTentSlot, ...] = ()
+    stamp_slots: tuple[PersonalBoardStampSlot, ...] = ()
+    specimen_grid_slots: tuple[PersonalBoardSpecimenSlot, ...] = ()
+    # row_index -> worker row, so actions skip the linear row scan.
+    _rows_by_index: dict[int, PersonalBoardWorkerRow] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        # frozen=True blocks plain assignment; go through object.__setattr__.
+        object.__setattr__(
+            self, "_rows_by_index", {row.row_index: row for row in self.worker_rows}
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SpecialActionTile:
+    tile_id: int
+    requirements: dict[str, Any] = field(default_factory=dict)
+    actions: tuple[SimpleActionInfo, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class Species:
+    token_id: str
+    museum_row: str
+    museum_col: int
+    kind: SpecimenKind
+    colour: SealColor
+
+
+class TheoryTrackSpace(NamedTuple):
+    space_id: int
+    book_multiplier: int
+
+
+@dataclass(slots=True)
+class AllGameData:
+    """Every parsed data set, as produced by :func:`load_all_data`."""
+
+    academy_scrolls: Mapping[int, AcademyScroll] = field(default_factory=dict)
+    beagle_goals: Mapping[int, BeagleGoal] = field(default_factory=dict)
+    campsites: Mapping[str, Campsite] = field(default_factory=dict)
+    correspondence_tiles: Mapping[int, CorrespondenceTile] = field(default_factory=dict)
+    crew_cards: Mapping[int, CrewCard] = field(default_factory=dict)
+    ocean_tracks: Mapping[str, TrackSpace] = field(default_factory=dict)
+    island_tracks: Mapping[str, Mapping[str, TrackSpace]] = field(default_factory=dict)
+    main_board_actions: Mapping[str, BoardActionLocation] = field(default_factory=dict)
+    objective_display_area: ObjectiveDisplayAreaInfo | None = None
+    objective_tiles: Mapping[int, ObjectiveTile] = field(default_factory=dict)
+    starting_objective_tiles: Mapping[int, ObjectiveTile] = field(default_factory=dict)
+    personal_board: PersonalBoardDefinition | None = None
+    special_action_tiles: Mapping[int, SpecialActionTile] = field(default_factory=dict)
+    species: Mapping[str, Species] = field(default_factory=dict)
+    theory_track: Mapping[int, TheoryTrackSpace] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Loaders
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def load_academy_scrolls() -> Mapping[int, AcademyScroll]:
+    """Load academy scroll rows keyed by scroll_row."""
+    scroll_data = _build_table(
+        _load_json("academy_scrolls.json"),
+        _parse_academy_scroll,
+        "scroll_row",
+        "academy_scrolls.json",
+    )
+    logger.info("Parsed %s academy scrolls", len(scroll_data))
+    return MappingProxyType(scroll_data)
+
+
+@functools.cache
+def load_beagles_goals() -> Mapping[int, BeagleGoal]:
+    """Load Beagle goal cards keyed by goal_id."""
+    goal_data = _build_table(
+        _load_json("beagles_goals.json"),
+        _build_beagle_goal,
+        "goal_id",
+        "beagles_goals.json",
+    )
+    logger.info("Parsed %s beagle goals", len(goal_data))
+    return MappingProxyType(goal_data)
+
+
+@functools.cache
+def load_campsites() -> Mapping[str, Campsite]:
+    """Load campsite areas keyed by campsite_area_id."""
+    campsite_data = _build_table(
+        _load_json("campsites.json"),
+        _build_campsite,
+        "campsite_area_id",
+        "campsites.json",
+    )
+    logger.info("Parsed %s campsites", len(campsite_data))
+    return MappingProxyType(campsite_data)
+
+
+@functools.cache
+def load_correspondences_tiles() -> Mapping[int, CorrespondenceTile]:
+    """Load correspondence tiles keyed by tile_id."""
+    tile_data = _build_table(
+        _load_json("correspondances_tiles.json"),
+        _build_correspondence_tile,
+        "tile_id",
+        "correspondances_tiles.json",
+    )
+    logger.info("Parsed %s correspondence tiles", len(tile_data))
+    return MappingProxyType(tile_data)
+
+
+@functools.cache
+def load_crew_cards() -> Mapping[int, CrewCard]:
+    """Load crew cards keyed by card_id."""
+    card_data = _build_table(
+        _load_json("crew_cards.json"), _build_crew_card, "card_id", "crew_cards.json"
+    )
+    logger.info("Parsed %s crew cards", len(card_data))
+    return MappingProxyType(card_data)
+
+
+
+# Per-item shape checks on the shipped (known-good) data files only run
+# in debug interpreters; `python -O` elides them entirely.
+_STRICT = __debug__
+
+# Plain-dict lookup tables for enum conversion at the parse boundary.
+# EnumMeta.__getitem__ goes through the metaclass on every call; a dict
+# populated once is a single hash probe.
+_SEAL_LUT = dict(SealColor.__members__)
+_SPECIMEN_LUT = dict(SpecimenKind.__members__)
+_TRACK_LUT = {member.value: member for member in TrackType}
+_OBJECTIVE_REQ_LUT = dict(ObjectiveRequirementType.__members__)
+_ACTION_LUT = {member.value: member for member in ActionType}
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values drawn from the files' small closed vocabularies.
+
+    Repeated field values (action types, diary types, colours, kinds)
+    collapse to one shared str each, so later equality checks hit the
+    pointer-identity fast path.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@functools.lru_cache(maxsize=512)
+def _shared_action(
+    type_: Any, value: Any, timing: Any = None, choice_source: Any = None
+) -> SimpleActionInfo:
+    return SimpleActionInfo(type_, value, timing, choice_source)
+
+
+def _make_action(
+    type_: Any, value: Any, timing: Any = None, choice_source: Any = None
+) -> SimpleActionInfo:
+    """Flyweight SimpleActionInfo constructor.
+
+    Identical option-less actions ("gain 1 coin" appears on dozens of
+    slots) come back as one shared instance; unhashable values fall
+    through to a plain construction.
+    """
+    try:
+        return _shared_action(type_, value, timing, choice_source)
+    except TypeError:
+        return SimpleActionInfo(type_, value, timing, choice_source)
+
+
+def _parse_actions(raw: Any, ctx: str) -> tuple[SimpleActionInfo, ...]:
+    """Parse one raw action list into SimpleActionInfo records.
+
+    Shared by every loader that reads an ``actions``-style list; ``ctx``
+    names the caller for log messages. Non-list input yields an empty
+    list, non-dict entries are skipped.
+    """
+    if not isinstance(raw, list):
+        if raw is not None:
+            logger.warning("Expected a list of actions in %s, got %r", ctx, raw)
+        return ()
+    make = _make_action
+    # A comprehension pre-sizes the result and skips the bound append.
+    if _STRICT:
+        raw = [act_item for act_item in raw if isinstance(act_item, dict)]
+    # The conditional avoids probing cost_modifier when value exists,
+    # which is the common case across the data files.
+    return tuple(
+        make(
+            _ACTION_LUT.get(raw_type := act_item.get("type"))
+            or _intern(raw_type),
+            act_item.get("value")
+            if "value" in act_item
+            else act_item.get("cost_modifier"),
+        )
+        for act_item in raw
+    )
+
+
+
+_REQUIRED = object()
+
+
+def _compile_record_parser(cls: type, fields: tuple[tuple, ...]):
+    """Generate an ``item -> cls(...)`` parser for a flat record schema.
+
+    ``fields`` lists one spec per constructor argument, in order:
+    ``("key",)`` for a required key, ``("key", default)`` for an
+    optional one, and a third element names a converter callable applied
+    to the fetched value (``("key", _REQUIRED, conv)`` keeps the key
+    required). The generated function is compiled once via exec with the
+    keys as literal string constants, so each parse runs as
+    straight-line bytecode with no per-field Python dispatch.
+    """
+    args = []
+    namespace: dict[str, Any] = {"_cls": cls}
+    for i, spec in enumerate(fields):
+        if len(spec) == 1 or spec[1] is _REQUIRED:
+            fetch = f'item["{spec[0]}"]'
+        else:
+            namespace[f"_d{i}"] = spec[1]
+            fetch = f'item.get("{spec[0]}", _d{i})'
+        if len(spec) == 3:
+            namespace[f"_c{i}"] = spec[2]
+            fetch = f"_c{i}({fetch})"
+        args.append(fetch)
+    source = f"def _parse(item):\n    return _cls({', '.join(args)})"
+    exec(source, namespace)  # noqa: S102 - schema is module-defined, not input
+    return namespace["_parse"]
+
+
+_parse_tent_slot = _compile_record_parser(
+    TentSlotInfo, (("slot_index",), ("placement_cost",))
+)
+_parse_display_component = _compile_record_parser(
+    ObjectiveDisplayComponent,
+    (
+        ("component_type", ""),
+        ("objective_type", ""),
+        ("count", 1),
+        ("description", None),
+    ),
+)
+_parse_theory_space = _compile_record_parser(
+    TheoryTrackSpace, (("space_id",), ("book_multiplier",))
+)
+_parse_species = _compile_record_parser(
+    Species,
+    (
+        ("token_id",),
+        ("museum_row",),
+        ("museum_col",),
+        ("kind", _REQUIRED, _SPECIMEN_LUT.__getitem__),
+        ("colour", _REQUIRED, _SEAL_LUT.__getitem__),
+    ),
+)
+# Scroll ids pre-materialized and interned once; row numbers are tiny
+# (1-4 on the physical board), so a tuple index replaces per-row
+# string formatting.
+_SCROLL_IDS = tuple(sys.intern(f"scroll_{i}") for i in range(8))
+
+
+def _scroll_id(row: int) -> str:
+    return _SCROLL_IDS[row] if 0 <= row < len(_SCROLL_IDS) else f"scroll_{row}"
+
+
+_parse_academy_scroll = _compile_record_parser(
+    AcademyScroll,
+    (
+        ("scroll_row", _REQUIRED, _scroll_id),
+        ("scroll_row",),
+        ("cost",),
+        ("slots",),
+    ),
+)
+_parse_scoring_condition = _compile_record_parser(
+    ScoringCondition,
+    (
+        ("type", _REQUIRED, _intern),
+        ("color", None, _intern),
+        ("kind", None, _intern),
+        ("points_per", 0),
+    ),
+)
+
+
+
+def _parse_action(action_dict: Any, context: str) -> SimpleActionInfo | None:
+    """Parse one full action dict (CHOICE options, timing, choice_source).
+
+    Richer sibling of :func:`_parse_actions`, shared by the personal
+    board and special action tile loaders.
+    """
+    if not isinstance(action_dict, dict) or not action_dict:
+        return None
+    action_type_str = action_dict.get("type")
+    if not action_type_str:
+        logger.warning("Action without type in %s: %s", context, action_dict)
+        return None
+    try:
+        action_type_val: ActionType | str = _ACTION_LUT[action_type_str]
+    except KeyError:
+        logger.warning("Unknown action type %s in %s", action_type_str, context)
+        action_type_val = _intern(action_type_str)
+    options = None
+    if action_type_val is ActionType.CHOICE:
+        options = []
+        for opt_item in action_dict.get("options", []):
+            parsed_opt = _parse_action(opt_item, context)
+            if parsed_opt:
+                options.append(parsed_opt)
+        value = action_dict.get("value")
+    else:
+        value = action_dict.get("value")
+        if value is None:
+            # Only fall back to the cost_modifier spelling when needed.
+            value = action_dict.get("cost_modifier")
+    if options is None:
+        return _make_action(
+            action_type_val,
+            value,
+            action_dict.get("timing"),
+            action_dict.get("choice_source"),
+        )
+    return SimpleActionInfo(
+        action_type_val,
+        value,
+        action_dict.get("timing"),
+        action_dict.get("choice_source"),
+        tuple(options),
+    )
+
+
+def _parse_track_spaces(raw_data: Any, track_name: str) -> dict[str, TrackSpace]:
+    """Parse a list of track space dicts into TrackSpace records keyed by id."""
+    track_data: dict[str, TrackSpace] = {}
+    if not isinstance(raw_data, list):
+        logger.error("%s did not contain a list", track_name)
+        return track_data
+    _get = dict.get
+    errors: list[tuple[Any, KeyError]] = []
+    for item in raw_data:
+        if _STRICT and not isinstance(item, dict):
+            logger.warning("Skipping non-dict item in %s: %s", track_name, item)
+            continue
+        try:
+            # Interned ids: every space names its successors, so each id
+            # string recurs in the next lists and as a dict key.
+            space_id = _intern(item["id"])
+            # Positional construction: keyword dispatch costs on the
+            # biggest files, and the field order is stable.
+            track_data[space_id] = TrackSpace(
+                space_id,
+                _get(item, "silver_banner", False),
+                _get(item, "beagle_goal", False),
+                _parse_actions(_get(item, "actions"), track_name),
+                _get(item, "has_specimen", False),
+                tuple(_intern(target) for target in _get(item, "next", ())),
+                _intern(_get(item, "spawns_explorer_on_island")),
+                _intern(_get(item, "campsite_area_id")),
+                _get(item, "golden_ribbon_vp"),
+            )
+        except KeyError as e:
+            errors.append((item, e))
+    if errors:
+        logger.error(
+            "Skipped %d track space items; first: %r", len(errors), errors[:3]
+        )
+    logger.info("Parsed %s track spaces from %s", len(track_data), track_name)
+    return track_data
+
+
+class TrackSpaceTable(NamedTuple):
+    """Structure-of-arrays view over one track's spaces.
+
+    The three per-space booleans are packed into int bitmasks indexed by
+    row (bit i == row i), so scans like "which spaces carry a silver
+    banner" are a single int of set bits instead of an attribute walk
+    over every TrackSpace. ``golden_ribbon_vp`` is a compact int16
+    column; -1 marks spaces without a ribbon.
+    """
+
+    ids: tuple[str, ...]
+    index: dict[str, int]
+    silver_banner_mask: int
+    beagle_goal_mask: int
+    has_specimen_mask: int
+    golden_ribbon_vp: array
+
+    def rows_with(self, mask: int):
+        """Yield (row, space_id) for every set bit in ``mask``."""
+        ids = self.ids
+        row = 0
+        while mask:
+            if mask & 1:
+                yield row, ids[row]
+            mask >>= 1
+            row += 1
+
+
+def build_track_table(spaces: Mapping[str, TrackSpace]) -> TrackSpaceTable:
+    """Pack one parsed track into a :class:`TrackSpaceTable`."""
+    ids = tuple(spaces)
+    index = {space_id: row for row, space_id in enumerate(ids)}
+    silver = beagle = specimen = 0
+    ribbons = array("h", bytes(0))
+    for row, space in enumerate(spaces.values()):
+        bit = 1 << row
+        if space.silver_banner:
+            silver |= bit
+        if space.beagle_goal:
+            beagle |= bit
+        if space.has_specimen:
+            specimen |= bit
+        vp = space.golden_ribbon_vp
+        ribbons.append(-1 if vp is None else vp)
+    return TrackSpaceTable(ids, index, silver, beagle, specimen, ribbons)
+
+
+class TrackGraph(NamedTuple):
+    """Compressed-sparse-row view over one track's ``next`` links.
+
+    Space ids compact to int rows; the out-edges of row ``i`` sit in
+    ``edges[offsets[i]:offsets[i + 1]]``, so a movement scan walks two
+    contiguous int32 columns instead of chasing per-space str lists.
+    Link targets outside the track (ship transfers and the like) get
+    terminal rows past ``len(offsets) - 1`` with no out-edges of their
+    own. Same stdlib-array layout as :class:`TrackSpaceTable`.
+    """
+
+    ids: tuple[str, ...]
+    index: dict[str, int]
+    offsets: array
+    edges: array
+
+    def neighbors(self, row: int) -> array:
+        """Out-edge rows of ``row`` (rows with an ``offsets`` entry only)."""
+        return self.edges[self.offsets[row] : self.offsets[row + 1]]
+
+
+def build_track_graph(spaces: Mapping[str, TrackSpace]) -> TrackGraph:
+    """Pack the ``next`` links of one parsed track into a :class:`TrackGraph`."""
+    ids = list(spaces)
+    index = {space_id: row for row, space_id in enumerate(ids)}
+    offsets = array("i", [0])
+    edges = array("i", bytes(0))
+    for space in spaces.values():
+        for target in space.next:
+            row = index.get(target)
+            if row is None:
+                row = len(ids)
+                index[target] = row
+                ids.append(target)
+            edges.append(row)
+        offsets.append(len(edges))
+    return TrackGraph(tuple(ids), index, offsets, edges)
+
+
+class SpeciesTable(NamedTuple):
+    """Structure-of-arrays view over the species tokens.
+
+    Museum coordinates and the kind/colour enum ordinals sit in compact
+    uint8/int16 columns indexed by row; ``index`` maps token_id to row.
+    ``museum_row`` holds the row letter as an offset from "A". The same
+    stdlib-array layout as :class:`TrackSpaceTable`.
+    """
+
+    ids: tuple[str, ...]
+    index: dict[str, int]
+    museum_row: array
+    museum_col: array
+    kind: array
+    colour: array
+
+
+def build_species_table(species: Mapping[str, Species]) -> SpeciesTable:
+    """Pack the parsed species mapping into a :class:`SpeciesTable`."""
+    ids = tuple(species)
+    index = {token_id: row for row, token_id in enumerate(ids)}
+    rows = array("B", bytes(0))
+    cols = array("h", bytes(0))
+    kinds = array("B", bytes(0))
+    colours = array("B", bytes(0))
+    kind_ordinals = {member: i for i, member in enumerate(SpecimenKind)}
+    for record in species.values():
+        rows.append(ord(record.museum_row) - ord("A"))
+        cols.append(record.museum_col)
+        kinds.append(kind_ordinals[record.kind])
+        colours.append(int(record.colour))
+    return SpeciesTable(ids, index, rows, cols, kinds, colours)
+
+
+@functools.cache
+def load_ocean_tracks() -> Mapping[str, TrackSpace]:
+    """Load the ocean track spaces keyed by space id."""
+    return MappingProxyType(
+        _parse_track_spaces(_load_json("ocean_tracks.json"), "ocean_tracks.json")
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def load_island_track(island_id: str) -> Mapping[str, TrackSpace]:
+    """Load one island track (``"A"``, ``"B"`` or ``"C"``) keyed by space id."""
+    filename = f"island_{island_id}_tracks.json"
+    return MappingProxyType(_parse_track_spaces(_load_json(filename), filename))
+
+
+@functools.cache
+def load_main_board_actions() -> Mapping[str, BoardActionLocation]:
+    """Load worker placement locations keyed by location_id."""
+    raw_data = _load_json("main_board_actions.json")
+    action_location_data: dict[str, BoardActionLocation] = {}
+    if not isinstance(raw_data, list):
+        logger.error("main_board_actions.json did not contain a list")
+        return MappingProxyType(action_location_data)
+    errors: list[tuple[Any, KeyError]] = []
+    for item in raw_data:
+        if _STRICT and not isinstance(item, dict):
+            logger.warning("Skipping non-location item in main_board_actions: %s", item)
+            continue
+        # Comment entries ({"_comment": ...}) are expected; one key probe
+        # skips them before any further validation.
+        if "_comment" in item:
+            continue
+        if "location_id" not in item:
+            logger.warning("Skipping non-location item in main_board_actions: %s", item)
+            continue
+        try:
+            wax_seal_requirements = {}
+            raw_req = item.get("wax_seal_requirements", {})
+            if isinstance(raw_req, dict):
+                for color_str, count in raw_req.items():
+                    wax_seal_requirements[_SEAL_LUT[color_str]] = count
+            base_actions = _parse_actions(
+                item.get("base_actions"), "main_board_actions"
+            )
+            distinction_bonuses: dict[str, tuple[DistinctionBonus, ...]] = {
+                "silver": (),
+                "golden": (),
+            }
+            raw_bonuses = item.get("distinction_bonuses", {})
+            if isinstance(raw_bonuses, dict):
+                for level in ("silver", "golden"):
+                    distinction_bonuses[level] = tuple(
+                        _distinction_bonus(
+                            _intern(bonus_item.get("type")),
+                            bonus_item.get("value"),
+                        )
+                        for bonus_item in raw_bonuses.get(level, [])
+                        if isinstance(bonus_item, dict)
+                    )
+            location_id = _intern(item["location_id"])
+            action_location_data[location_id] = BoardActionLocation(
+                location_id=location_id,
+                diary_type=_intern(item.get("diary_type", "OTHER")),
+                action_type=_intern(item["action_type"]),
+                placement_type=_intern(item.get("placement_type", "")),
+                locked=item.get("locked", False),
+                unlock_cost=item.get("unlock_cost"),
+                wax_seal_requirements=wax_seal_requirements,
+                base_actions=base_actions,
+                distinction_bonuses=distinction_bonuses,
+            )
+        except KeyError as e:
+            errors.append((item, e))
+    if errors:
+        logger.error(
+            "Skipped %d main board location items; first: %r", len(errors), errors[:3]
+        )
+    logger.info("Parsed %s main board locations", len(action_location_data))
+    return MappingProxyType(action_location_data)
+
+
+@functools.cache
+def load_objective_display_area() -> ObjectiveDisplayAreaInfo | None:
+    """Load the static objective display area description."""
+    raw_data = _load_json("objective_display_area.json")
+    if not isinstance(raw_data, dict):
+        logger.error("objective_display_area.json did not contain an object")
+        return None
+    raw_components = raw_data.get("components", [])
+    components: tuple[ObjectiveDisplayComponent, ...] = ()
+    if isinstance(raw_components, list):
+        components = tuple(
+            _parse_display_component(item)
+            for item in raw_components
+            if isinstance(item, dict)
+        )
+    return ObjectiveDisplayAreaInfo(
+        area_id=raw_data.get("area_id", "OBJECTIVE_DISPLAY_AREA"),
+        description=raw_data.get("description"),
+        components=components,
+        is_worker_placement_location=raw_data.get(
+            "is_worker_placement_location", False
+        ),
+    )
+
+
+# Which optional fields each requirement type carries: (uses_color,
+# uses_kind). Types absent from the table use neither; adding a new
+# requirement kind is one table row instead of another elif arm.
+_REQ_FIELD_SPEC = {
+    ObjectiveRequirementType.HAVE_SEALS: (True, False),
+    ObjectiveRequirementType.HAVE_SPECIMEN_RESEARCHED: (False, True),
+}
+
+
+def _parse_objective_tiles(raw_data: Any, filename: str) -> dict[int, ObjectiveTile]:
+    """Parse a list of objective tile dicts keyed by objective_id."""
+    tile_data: dict[int, ObjectiveTile] = {}
+    if not isinstance(raw_data, list):
+        logger.error("%s did not contain a list", filename)
+        return tile_data
+    errors: list[tuple[Any, KeyError]] = []
+    for item in raw_data:
+        if _STRICT and not isinstance(item, dict):
+            logger.warning("Skipping non-dict item in %s: %s", filename, item)
+            continue
+        try:
+            requirements = []
+            raw_reqs = item.get("requirements", [])
+            if isinstance(raw_reqs, list):
+                for req_item in raw_reqs:
+                    if not isinstance(req_item, dict):
+                        continue
+                    req_type_str = req_item.get("type")
+                    if not req_type_str:
+                        continue
+                    try:
+                        req_type = _OBJECTIVE_REQ_LUT[req_type_str]
+                    except KeyError:
+                        logger.warning(
+                            "Unknown requirement type %s in %s", req_type_str, filename
+                        )
+                        continue
+                    use_color, use_kind = _REQ_FIELD_SPEC.get(
+                        req_type, (False, False)
+                    )
+                    color_enum = None
+                    kind_enum: SpecimenKind | SealColor | None = None
+                    if use_color and (color_str := req_item.get("color")):
+                        color_enum = _SEAL_LUT.get(color_str)
+                        if color_enum is None:
+                            logger.warning("Unknown seal color %s", color_str)
+                    if use_kind and (kind_str := req_item.get("kind")):
+                        # The kind may be a specimen kind or a colour group.
+                        kind_enum = _SPECIMEN_LUT.get(kind_str) or _SEAL_LUT.get(
+                            kind_str
+                        )
+                        if kind_enum is None:
+                            logger.warning("Unknown specimen kind %s", kind_str)
+                    requirements.append(
+                        ObjectiveRequirement(
+                            type=req_type,
+                            color=color_enum,
+                            kind=kind_enum,
+                            count=req_item.get("count"),
+                        )
+                    )
+            tile_data[item["objective_id"]] = ObjectiveTile(
+                objective_id=item["objective_id"],
+                type=_intern(item.get("type", "silver")),
+                requirements=tuple(requirements),
+            )
+        except KeyError as e:
+            errors.append((item, e))
+    if errors:
+        logger.error(
+            "Skipped %d objective tile items; first: %r", len(errors), errors[:3]
+        )
+    logger.info("Parsed %s objective tiles from %s", len(tile_data), filename)
+    return tile_data
+
+
+@functools.cache
+def load_objective_tiles() -> Mapping[int, ObjectiveTile]:
+    """Load the main objective tiles keyed by objective_id."""
+    return MappingProxyType(
+        _parse_objective_tiles(
+            _load_json("objective_tiles.json"), "objective_tiles.json"
+        )
+    )
+
+
+@functools.cache
+def load_starting_objectives_tiles() -> Mapping[int, ObjectiveTile]:
+    """Load the starting objective tiles keyed by objective_id."""
+    return MappingProxyType(
+        _parse_objective_tiles(
+            _load_json("starting_objectives_tiles.json"),
+            "starting_objectives_tiles.json",
+        )
+    )
+
+
+def _parse_board_slots(
+    raw_data: dict[str, Any],
+    key: str,
+    builder: Any,
+    ctx: str,
+    require: str | None = None,
+) -> tuple[Any, ...]:
+    """One guarded pass over a personal-board slot list.
+
+    Shared loop body for every slot family on the board; ``require``
+    names a key whose absence skips the item silently (comment-style
+    entries), anything else missing is logged per item.
+    """
+    out = []
+    for slot_item in raw_data.get(key, []):
+        if not isinstance(slot_item, dict):
+            continue
+        if require is not None and require not in slot_item:
+            continue
+        try:
+            out.append(builder(slot_item))
+        except KeyError as e:
+            logger.error("Missing key %s in %s item: %s", e, ctx, slot_item)
+    return tuple(out)
+
+
+def _build_board_seal_slot(slot_item: dict[str, Any]) -> PersonalBoardSealSlot:
+    return PersonalBoardSealSlot(
+        slot_index=slot_item["slot_index"],
+        placement_cost=slot_item["placement_cost"],
+        distinction_trigger=slot_item.get("distinction_trigger"),
+        reward_action=_parse_action(slot_item.get("reward_action"), "seal slot"),
+    )
+
+
+def _build_board_worker_row(row_item: dict[str, Any]) -> PersonalBoardWorkerRow:
+    return PersonalBoardWorkerRow(
+        row_index=row_item["row_index"],
+        max_seals=row_item["max_seals"],
+        has_starting_special_seal=row_item.get("has_starting_special_seal", False),
+        seal_slots=_parse_board_slots(
+            row_item, "seal_slots", _build_board_seal_slot, "seal slot"
+        ),
+    )
+
+
+def _build_board_objective_slot(
+    slot_item: dict[str, Any],
+) -> PersonalBoardObjectiveSlot:
+    raw_rewards = slot_item.get("reward_action", [])
+    if isinstance(raw_rewards, dict):
+        raw_rewards = [raw_rewards]
+    reward_actions = tuple(
+        parsed
+        for act_item in raw_rewards
+        if (parsed := _parse_action(act_item, "objective slot"))
+    )
+    return PersonalBoardObjectiveSlot(
+        slot_id=slot_item["slot_id"],
+        type=slot_item["type"],
+        position=slot_item["position"],
+        placement_cost=slot_item["placement_cost"],
+        reward_actions=reward_actions,
+    )
+
+
+def _build_board_tent_slot(slot_item: dict[str, Any]) -> PersonalBoardTentSlot:
+    return PersonalBoardTentSlot(
+        slot_index=slot_item["slot_index"],
+        revealed_action=_parse_action(slot_item.get("revealed_action"), "tent slot"),
+    )
+
+
+def _build_board_stamp_slot(slot_item: dict[str, Any]) -> PersonalBoardStampSlot:
+    return PersonalBoardStampSlot(
+        slot_index=slot_item["slot_index"],
+        revealed_action=_parse_action(slot_item.get("revealed_action"), "stamp slot"),
+    )
+
+
+def _build_board_specimen_slot(
+    slot_item: dict[str, Any],
+) -> PersonalBoardSpecimenSlot:
+    return PersonalBoardSpecimenSlot(
+        specimen_token_id=slot_item["specimen_token_id"]
+    )
+
+
+@functools.cache
+def load_personal_board() -> PersonalBoardDefinition | None:
+    """Load the personal player board definition."""
+    raw_data = _load_json("personal_board.json")
+    if not isinstance(raw_data, dict):
+        logger.error("personal_board.json did not contain an object")
+        return None
+
+    objective_pair_bonus = None
+    raw_pair = raw_data.get("objective_pair_bonus")
+    if isinstance(raw_pair, dict):
+        objective_pair_bonus = ObjectivePairBonus(
+            condition=tuple(raw_pair.get("condition", ())),
+            reward_action=_parse_action(
+                raw_pair.get("reward_action"), "objective pair bonus"
+            ),
+        )
+
+    board = PersonalBoardDefinition(
+        board_id=raw_data.get("board_id", "STANDARD_PLAYER_BOARD"),
+        worker_rows=_parse_board_slots(
+            raw_data, "worker_rows", _build_board_worker_row, "worker row"
+        ),
+        objective_slots=_parse_board_slots(
+            raw_data,
+            "objective_slots",
+            _build_board_objective_slot,
+            "objective slot",
+            require="slot_id",
+        ),
+        objective_pair_bonus=objective_pair_bonus,
+        tent_slots=_parse_board_slots(
+            raw_data, "tent_slots", _build_board_tent_slot, "tent slot"
+        ),
+        stamp_slots=_parse_board_slots(
+            raw_data, "stamp_slots", _build_board_stamp_slot, "stamp slot"
+        ),
+        specimen_grid_slots=_parse_board_slots(
+            raw_data, "specimen_grid_slots", _build_board_specimen_slot, "specimen slot"
+        ),
+    )
+    logger.info("Parsed personal board %s", board.board_id)
+    return board
+
+
+
+def _build_table(
+    raw_data: Any, builder: Any, key: str, filename: str
+) -> dict[Any, Any]:
+    """Shared list-of-records -> keyed-dict skeleton for the flat loaders.
+
+    Applies the usual top-level list check, the _STRICT per-item guard
+    and batched error collection, keying each built record by ``key``.
+    """
+    table: dict[Any, Any] = {}
+    if not isinstance(raw_data, list):
+        logger.error("%s did not contain a list", filename)
+        return table
+    errors: list[tuple[Any, Exception]] = []
+    for item in raw_data:
+        if _STRICT and not isinstance(item, dict):
+            logger.warning("Skipping non-dict item in %s: %s", filename, item)
+            continue
+        try:
+            table[_intern(item[key])] = builder(item)
+        except KeyError as e:
+            errors.append((item, e))
+    if errors:
+        logger.error(
+            "Skipped %d %s items; first: %r", len(errors), filename, errors[:3]
+        )
+    return table
+
+
+def _build_beagle_goal(item: dict[str, Any]) -> BeagleGoal:
+    """Build one BeagleGoal record (for :func:`_build_table`)."""
+    raw_condition = item.get("scoring_condition")
+    condition = None
+    if isinstance(raw_condition, dict):
+        condition = _parse_scoring_condition(raw_condition)
+    return BeagleGoal(
+        goal_id=item["goal_id"],
+        description=item.get("description", ""),
+        scoring_condition=condition,
+    )
+
+
+def _build_campsite(item: dict[str, Any]) -> Campsite:
+    """Build one Campsite record (for :func:`_build_table`)."""
+    return Campsite(
+        campsite_area_id=_intern(item["campsite_area_id"]),
+        originating_track_space_id=_intern(item["originating_track_space_id"]),
+        track_type=_TRACK_LUT[item["track_type"]],
+        tent_slots=tuple(
+            _parse_tent_slot(slot_item)
+            for slot_item in item.get("tent_slots", [])
+            if isinstance(slot_item, dict)
+        ),
+        actions_on_placement=_parse_actions(
+            item.get("actions_on_placement"), "campsites"
+        ),
+    )
+
+
+def _build_correspondence_tile(item: dict[str, Any]) -> CorrespondenceTile:
+    """Build one CorrespondenceTile record (for :func:`_build_table`)."""
+    return CorrespondenceTile(
+        tile_id=item["tile_id"],
+        first_place_rewards=_parse_actions(
+            item.get("first_place_rewards"), "correspondences_tiles"
+        ),
+        second_place_rewards=_parse_actions(
+            item.get("second_place_rewards"), "correspondences_tiles"
+        ),
+    )
+
+
+def _build_crew_card(item: dict[str, Any]) -> CrewCard:
+    """Build one CrewCard record (for :func:`_build_table`)."""
+    activation_requirement = {}
+    raw_req = item.get("activation_requirement", {})
+    if isinstance(raw_req, dict):
+        for color_str, count in raw_req.items():
+            activation_requirement[_SEAL_LUT[color_str]] = count
+    return CrewCard(
+        card_id=item["card_id"],
+        starting_seal_color=_SEAL_LUT[item["starting_seal_color"]],
+        activation_requirement=activation_requirement,
+        achieved_actions=_parse_actions(item.get("achieved_actions"), "crew_cards"),
+    )
+
+
+def _build_special_tile(item: dict[str, Any]) -> SpecialActionTile:
+    """Build one SpecialActionTile record (for :func:`_build_table`)."""
+    raw_actions = item.get("actions", [])
+    actions: tuple[SimpleActionInfo, ...] = ()
+    if isinstance(raw_actions, list):
+        actions = tuple(
+            parsed
+            for act_item in raw_actions
+            if (parsed := _parse_action(act_item, "special_action_tiles"))
+        )
+    return SpecialActionTile(
+        tile_id=item["tile_id"],
+        requirements=item.get("requirements", {}),
+        actions=actions,
+    )
+
+
+@functools.cache
+def load_special_action_tiles() -> Mapping[int, SpecialActionTile]:
+    """Load the special action tiles keyed by tile_id."""
+    tile_data = _build_table(
+        _load_json("special_action_tiles.json"),
+        _build_special_tile,
+        "tile_id",
+        "special_action_tiles.json",
+    )
+    logger.info("Parsed %s special action tiles", len(tile_data))
+    return MappingProxyType(tile_data)
+
+
+@functools.cache
+def load_species() -> Mapping[str, Species]:
+    """Load specimen tokens keyed by token_id."""
+    species_data = _build_table(
+        _load_json("species.json"), _parse_species, "token_id", "species.json"
+    )
+    logger.info("Parsed %s species", len(species_data))
+    return MappingProxyType(species_data)
+
+
+@functools.cache
+def load_theory_of_evolution_track() -> Mapping[int, TheoryTrackSpace]:
+    """Load the theory of evolution track keyed by space_id."""
+    track_data = _build_table(
+        _load_json("theory_of_evolution_track.json"),
+        _parse_theory_space,
+        "space_id",
+        "theory_of_evolution_track.json",
+    )
+    logger.info("Parsed %s theory track spaces", len(track_data))
+    return MappingProxyType(track_data)
+
+
+def _snapshot_file() -> Path:
+    """Cache-file path for the pickle snapshot, keyed by the data bytes.
+
+    The name embeds a sha256 over every data file, so editing any JSON
+    invalidates the snapshot automatically.
+    """
+    digest = hashlib.sha256()
+    blobs = _raw_blobs()
+    for name in sorted(blobs):
+        digest.update(name.encode())
+        digest.update(blobs[name])
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "dj_engine" / f"{digest.hexdigest()}.pkl"
+
+
+def _snapshot_payload(all_data: AllGameData) -> dict[str, Any]:
+    """Plain-dict form of ``all_data`` (mappingproxy objects cannot pickle)."""
+    return {
+        "academy_scrolls": dict(all_data.academy_scrolls),
+        "beagle_goals": dict(all_data.beagle_goals),
+        "campsites": dict(all_data.campsites),
+        "correspondence_tiles": dict(all_data.correspondence_tiles),
+        "crew_cards": dict(all_data.crew_cards),
+        "ocean_tracks": dict(all_data.ocean_tracks),
+        "island_tracks": {
+            key: dict(track) for key, track in all_data.island_tracks.items()
+        },
+        "main_board_actions": dict(all_data.main_board_actions),
+        "objective_display_area": all_data.objective_display_area,
+        "objective_tiles": dict(all_data.objective_tiles),
+        "starting_objective_tiles": dict(all_data.starting_objective_tiles),
+        "personal_board": all_data.personal_board,
+        "special_action_tiles": dict(all_data.special_action_tiles),
+        "species": dict(all_data.species),
+        "theory_track": dict(all_data.theory_track),
+    }
+
+
+def _from_snapshot(payload: dict[str, Any]) -> AllGameData:
+    """Rebuild an AllGameData from a pickled snapshot payload."""
+    wrapped = {
+        name: MappingProxyType(value) if isinstance(value, dict) else value
+        for name, value in payload.items()
+    }
+    wrapped["island_tracks"] = MappingProxyType(
+        {
+            key: MappingProxyType(track)
+            for key, track in payload["island_tracks"].items()
+        }
+    )
+    return AllGameData(**wrapped)
+
+
+def load_all_data() -> AllGameData:
+    """Run every loader and return the combined game data.
+
+    With ``DJ_ENGINE_CACHE=1`` the combined result is also snapshotted
+    to a pickle under the user cache directory, keyed by a hash of the
+    data files; later processes skip JSON parsing and dataclass
+    construction entirely.
+
+    The per-file loaders fan out across a small thread pool: orjson
+    releases the GIL while parsing, so reads and parses of different
+    files overlap. Results come back from the memoized loaders, so a
+    second call is assembled from cache without touching the pool.
+    """
+    snapshot = None
+    if os.environ.get("DJ_ENGINE_CACHE") == "1":
+        snapshot = _snapshot_file()
+        if snapshot.exists():
+            try:
+                with open(snapshot, "rb") as f:
+                    all_data = _from_snapshot(pickle.load(f))
+                logger.info("Loaded game data from snapshot %s", snapshot)
+                return all_data
+            except (OSError, pickle.UnpicklingError, TypeError, KeyError) as e:
+                logger.warning("Ignoring unreadable snapshot %s: %s", snapshot, e)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            "academy_scrolls": pool.submit(load_academy_scrolls),
+            "beagle_goals": pool.submit(load_beagles_goals),
+            "campsites": pool.submit(load_campsites),
+            "correspondence_tiles": pool.submit(load_correspondences_tiles),
+            "crew_cards": pool.submit(load_crew_cards),
+            "ocean_tracks": pool.submit(load_ocean_tracks),
+            "island_a": pool.submit(load_island_track, "A"),
+            "island_b": pool.submit(load_island_track, "B"),
+            "island_c": pool.submit(load_island_track, "C"),
+            "main_board_actions": pool.submit(load_main_board_actions),
+            "objective_display_area": pool.submit(load_objective_display_area),
+            "objective_tiles": pool.submit(load_objective_tiles),
+            "starting_objective_tiles": pool.submit(load_starting_objectives_tiles),
+            "personal_board": pool.submit(load_personal_board),
+            "special_action_tiles": pool.submit(load_special_action_tiles),
+            "species": pool.submit(load_species),
+            "theory_track": pool.submit(load_theory_of_evolution_track),
+        }
+        results = {name: future.result() for name, future in futures.items()}
+    all_data = AllGameData(
+        academy_scrolls=results["academy_scrolls"],
+        beagle_goals=results["beagle_goals"],
+        campsites=results["campsites"],
+        correspondence_tiles=results["correspondence_tiles"],
+        crew_cards=results["crew_cards"],
+        ocean_tracks=results["ocean_tracks"],
+        island_tracks={
+            "A": results["island_a"],
+            "B": results["island_b"],
+            "C": results["island_c"],
+        },
+        main_board_actions=results["main_board_actions"],
+        objective_display_area=results["objective_display_area"],
+        objective_tiles=results["objective_tiles"],
+        starting_objective_tiles=results["starting_objective_tiles"],
+        personal_board=results["personal_board"],
+        special_action_tiles=results["special_action_tiles"],
+        species=results["species"],
+        theory_track=results["theory_track"],
+    )
+    logger.info("Loaded all game data")
+    if snapshot is not None:
+        try:
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            with open(snapshot, "wb") as f:
+                pickle.dump(_snapshot_payload(all_data), f, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning("Could not write snapshot %s: %s", snapshot, e)
+    return all_data
+
+
+class LazyGameData:
+    """Deferred-loading counterpart to :func:`load_all_data`.
+
+    Exposes the same attribute names as :class:`AllGameData`, but each
+    data set is parsed on first access via the memoized loaders, so a
+    process that only touches a couple of files never pays for the rest.
+    """
+
+    @functools.cached_property
+    def academy_scrolls(self) -> Mapping[int, AcademyScroll]:
+        return load_academy_scrolls()
+
+    @functools.cached_property
+    def beagle_goals(self) -> Mapping[int, BeagleGoal]:
+        return load_beagles_goals()
+
+    @functools.cached_property
+    def campsites(self) -> Mapping[str, Campsite]:
+        return load_campsites()
+
+    @functools.cached_property
+    def correspondence_tiles(self) -> Mapping[int, CorrespondenceTile]:
+        return load_correspondences_tiles()
+
+    @functools.cached_property
+    def crew_cards(self) -> Mapping[int, CrewCard]:
+        return load_crew_cards()
+
+    @functools.cached_property
+    def ocean_tracks(self) -> Mapping[str, TrackSpace]:
+        return load_ocean_tracks()
+
+    @functools.cached_property
+    def island_tracks(self) -> Mapping[str, dict[str, TrackSpace]]:
+        return {island_id: load_island_track(island_id) for island_id in "ABC"}
+
+    @functools.cached_property
+    def main_board_actions(self) -> Mapping[str, BoardActionLocation]:
+        return load_main_board_actions()
+
+    @functools.cached_property
+    def objective_display_area(self) -> ObjectiveDisplayAreaInfo | None:
+        return load_objective_display_area()
+
+    @functools.cached_property
+    def objective_tiles(self) -> Mapping[int, ObjectiveTile]:
+        return load_objective_tiles()
+
+    @functools.cached_property
+    def starting_objective_tiles(self) -> Mapping[int, ObjectiveTile]:
+        return load_starting_objectives_tiles()
+
+    @functools.cached_property
+    def personal_board(self) -> PersonalBoardDefinition | None:
+        return load_personal_board()
+
+    @functools.cached_property
+    def special_action_tiles(self) -> Mapping[int, SpecialActionTile]:
+        return load_special_action_tiles()
+
+    @functools.cached_property
+    def species(self) -> Mapping[str, Species]:
+        return load_species()
+
+    @functools.cached_property
+    def theory_track(self) -> Mapping[int, TheoryTrackSpace]:
+        return load_theory_of_evolution_track()
+
+
+# Every memoized loader, for clear_data_caches().
+_CACHED_LOADERS = (
+    load_academy_scrolls,
+    load_beagles_goals,
+    load_campsites,
+    load_correspondences_tiles,
+    load_crew_cards,
+    load_ocean_tracks,
+    load_island_track,
+    load_main_board_actions,
+    load_objective_display_area,
+    load_objective_tiles,
+    load_starting_objectives_tiles,
+    load_personal_board,
+    load_special_action_tiles,
+    load_species,
+    load_theory_of_evolution_track,
+)
+
+
+def clear_data_caches() -> None:
+    """Drop every memoized loader result (mainly for test isolation).
+
+    The loaders return shared objects once cached, so callers must treat
+    the data as read-only; tests that need a fresh parse call this first.
+    """
+    for loader in _CACHED_LOADERS:
+        loader.cache_clear()
+    for name in _LAZY_GLOBALS:
+        globals().pop(name, None)
+
+
+# PEP 562: module-level data constants materialised on first attribute
+# access, so ``from dj_engine.data_loader import SPECIES_DATA`` style use
+# only parses the files it touches.
+_LAZY_GLOBALS = {
+    "ACADEMY_SCROLLS_DATA": load_academy_scrolls,
+    "BEAGLE_GOALS_DATA": load_beagles_goals,
+    "CAMPSITES_DATA": load_campsites,
+    "CORRESPONDENCE_TILES_DATA": load_correspondences_tiles,
+    "CREW_CARDS_DATA": load_crew_cards,
+    "OCEAN_TRACKS_DATA": load_ocean_tracks,
+    "MAIN_BOARD_ACTIONS_DATA": load_main_board_actions,
+    "OBJECTIVE_TILES_DATA": load_objective_tiles,
+    "STARTING_OBJECTIVE_TILES_DATA": load_starting_objectives_tiles,
+    "PERSONAL_BOARD_DATA": load_personal_board,
+    "SPECIAL_ACTION_TILES_DATA": load_special_action_tiles,
+    "SPECIES_DATA": load_species,
+    "THEORY_TRACK_DATA": load_theory_of_evolution_track,
+}
+
+
+def __getattr__(name: str) -> Any:
+    loader = _LAZY_GLOBALS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = loader()
+    globals()[name] = value
+    return value
@@ -0,0 +1,100 @@
+"""Small helpers shared by the action modules."""
+
+import logging
+
+from .constants import SealColor
+from .data_loader import BoardActionLocation
+from .exceptions import InvalidActionError
+from .state import WORKER_PLACED_BIT, GameState, PlayerState, Worker
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_player_and_worker(
+    game_state: GameState, player_index: int, worker_id: int
+) -> tuple[PlayerState, Worker]:
+    """Shared entry validation for every worker placement action.
+
+    Checks the turn, resolves the worker and rejects already-placed
+    workers, raising InvalidActionError on any failure.
+    """
+    if game_state.current_player_index != player_index:
+        raise InvalidActionError(f"It is not player {player_index}'s turn")
+    # current_player is a cache maintained by set_current_player(); fall
+    # back to the players list so states built without it still resolve.
+    player_state = game_state.current_player
+    if player_state is None or player_state.player_index != player_index:
+        if not 0 <= player_index < len(game_state.players):
+            raise InvalidActionError(f"No player {player_index}")
+        player_state = game_state.players[player_index]
+    worker = player_state.workers_by_id.get(worker_id)
+    if worker is None:
+        raise InvalidActionError(f"Player {player_index} has no worker {worker_id}")
+    if worker.state & WORKER_PLACED_BIT:
+        raise InvalidActionError(f"Worker {worker_id} is already placed")
+    return player_state, worker
+
+
+def can_afford(player_state: PlayerState, total_cost: int) -> bool:
+    """Return True when the player has enough coins for ``total_cost``."""
+    return player_state.coins >= total_cost
+
+
+def spend_coins(player_state: PlayerState, amount: int) -> None:
+    """Deduct coins, raising if the player cannot pay."""
+    if player_state.coins < amount:
+        raise InvalidActionError(
+            f"Player {player_state.player_index} cannot pay {amount} coins"
+        )
+    player_state.coins -= amount
+
+
+def gain_coins(player_state: PlayerState, amount: int) -> None:
+    """Add coins to the player's supply."""
+    player_state.coins += amount
+
+
+def spend_temp_knowledge(player_state: PlayerState, amount: int) -> None:
+    """Deduct temporary knowledge, raising if not available."""
+    if player_state.temporary_knowledge < amount:
+        raise InvalidActionError(
+            f"Player {player_state.player_index} cannot spend {amount} knowledge"
+        )
+    player_state.temporary_knowledge -= amount
+
+
+def worker_seal_count(worker: Worker, color: SealColor) -> int:
+    """Number of seals of ``color`` on one worker."""
+    return worker.seals[color]
+
+
+def check_wax_seal_req(
+    player_state: PlayerState, worker: Worker, requirements: dict[SealColor, int]
+) -> bool:
+    """Check a worker against a location's wax seal requirements.
+
+    PURPLE seals are wild and may stand in for any missing colour.
+    """
+    wild = worker.seals[SealColor.PURPLE]
+    for color, needed in requirements.items():
+        have = worker.seals[color]
+        if have < needed:
+            shortfall = needed - have
+            if wild >= shortfall:
+                wild -= shortfall
+            else:
+                return False
+    return True
+
+
+def calculate_placement_penalty(
+    game_state: GameState,
+    location_data: BoardActionLocation,
+) -> int:
+    """Coin penalty for placing on an already-resolved location.
+
+    Placing on an occupied location costs one coin per worker already
+    there (magnifying glass stacking rule, simplified).
+    """
+    occupants = game_state.main_board_workers.get(location_data.location_id, [])
+    return len(occupants)
@@ -0,0 +1,13 @@
+"""Engine exception hierarchy."""
+
+
+class GameError(Exception):
+    """Base class for all engine errors."""
+
+
+class InvalidActionError(GameError):
+    """Raised when a requested action fails validation."""
+
+
+class DataLoadError(GameError):
+    """Raised when a data file is missing or malformed."""
@@ -0,0 +1,17 @@
+"""Logging configuration for high-throughput simulation runs."""
+
+import logging
+
+
+def configure_engine_logging(level: int = logging.WARNING) -> None:
+    """Quiet the engine loggers for simulation workloads.
+
+    Sets the ``dj_engine`` package logger to ``level`` and installs a
+    NullHandler, so every ``logger.info``/``debug`` call in the action
+    modules collapses to the ``isEnabledFor`` level compare instead of
+    walking the handler chain.
+    """
+    engine_logger = logging.getLogger("dj_engine")
+    engine_logger.setLevel(level)
+    if not any(isinstance(h, logging.NullHandler) for h in engine_logger.handlers):
+        engine_logger.addHandler(logging.NullHandler())
@@ -0,0 +1,194 @@
+"""Mutable runtime game state."""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from .constants import (
+    ACADEMY_COLS,
+    ACADEMY_ROWS,
+    STARTING_WORKERS,
+    PlayerColor,
+    SealColor,
+)
+from .data_loader import AllGameData
+
+logger = logging.getLogger(__name__)
+
+
+# Layout of the packed Worker.state bitfield: bit 0 is the placed flag,
+# bits 1-3 count filled seal slots (max 6), bits 4-6 hold the row index.
+WORKER_PLACED_BIT = 1 << 0
+SEAL_SLOT_SHIFT = 1
+SEAL_SLOT_MASK = 0b111 << SEAL_SLOT_SHIFT
+ROW_INDEX_SHIFT = 4
+ROW_INDEX_MASK = 0b111 << ROW_INDEX_SHIFT
+
+
+@dataclass(slots=True)
+class Worker:
+    """One worker pawn on a player's personal board row.
+
+    The placed flag, filled seal slot count and row index are packed
+    into the single ``state`` int so actions touch one attribute; the
+    properties below keep cold paths readable.
+    """
+
+    worker_id: int
+    state: int = 0
+    # Seal counts indexed by SealColor ordinal; the colour set is closed,
+    # so a flat int list beats a dict on the per-action update path.
+    seals: list[int] = field(default_factory=lambda: [0] * len(SealColor))
+
+    @classmethod
+    def create(cls, worker_id: int, row_index: int) -> "Worker":
+        """Build an unplaced worker assigned to ``row_index``."""
+        return cls(worker_id=worker_id, state=(row_index & 0b111) << ROW_INDEX_SHIFT)
+
+    @property
+    def is_placed(self) -> bool:
+        return bool(self.state & WORKER_PLACED_BIT)
+
+    @is_placed.setter
+    def is_placed(self, value: bool) -> None:
+        if value:
+            self.state |= WORKER_PLACED_BIT
+        else:
+            self.state &= ~WORKER_PLACED_BIT
+
+    @property
+    def seal_slots_filled(self) -> int:
+        return (self.state & SEAL_SLOT_MASK) >> SEAL_SLOT_SHIFT
+
+    @seal_slots_filled.setter
+    def seal_slots_filled(self, value: int) -> None:
+        self.state = (self.state & ~SEAL_SLOT_MASK) | (
+            (value << SEAL_SLOT_SHIFT) & SEAL_SLOT_MASK
+        )
+
+    @property
+    def row_index(self) -> int:
+        return (self.state & ROW_INDEX_MASK) >> ROW_INDEX_SHIFT
+
+
+@dataclass(slots=True)
+class PlayerState:
+    """Per-player mutable state."""
+
+    player_index: int
+    color: PlayerColor
+    coins: int = 5
+    temporary_knowledge: int = 0
+    victory_points: int = 0
+    workers: list[Worker] = field(default_factory=list)
+    # worker_id -> Worker index over ``workers``, kept in sync when workers
+    # are created or loaded so actions can avoid a linear scan.
+    workers_by_id: dict[int, Worker] = field(default_factory=dict)
+
+    def register_workers(self, workers: list[Worker]) -> None:
+        """Attach ``workers`` to this player and index them by id."""
+        self.workers = workers
+        self.workers_by_id = {w.worker_id: w for w in workers}
+
+
+@dataclass(slots=True)
+class GameState:
+    """Whole-game mutable state shared by every action module."""
+
+    players: list[PlayerState] = field(default_factory=list)
+    current_player_index: int = 0
+    # Direct reference to players[current_player_index], refreshed on turn
+    # transitions so actions skip the list indexing.
+    current_player: PlayerState | None = None
+    round_number: int = 1
+    # location_id -> list of (player_index, worker_id) placements this round.
+    # defaultdict so placement appends never allocate a throwaway default.
+    main_board_workers: defaultdict[str, list[tuple[int, int]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    # Academy seal display: flat ACADEMY_ROWS x ACADEMY_COLS grid indexed
+    # as row * ACADEMY_COLS + col (None = seal taken).
+    academy_seals: list[SealColor | None] = field(default_factory=list)
+    # player_index -> reserved position for next round (RESERVE_TURN_ORDER).
+    reserved_turn_order: dict[int, int] = field(default_factory=dict)
+
+    def set_current_player(self, player_index: int) -> None:
+        """Advance the turn to ``player_index`` (single write per turn end)."""
+        self.current_player_index = player_index
+        self.current_player = self.players[player_index]
+
+    def clone(self) -> "GameState":
+        """Cheap copy for search rollouts.
+
+        Only the mutable slice is duplicated: players/workers, the
+        placement map, the academy display and the reserved turn order.
+        The static AllGameData never lives on GameState, so rollouts
+        share it for free instead of paying copy.deepcopy for the whole
+        object graph.
+        """
+        players = []
+        for player in self.players:
+            new_player = PlayerState(
+                player_index=player.player_index,
+                color=player.color,
+                coins=player.coins,
+                temporary_knowledge=player.temporary_knowledge,
+                victory_points=player.victory_points,
+            )
+            new_player.register_workers(
+                [
+                    Worker(worker_id=w.worker_id, state=w.state, seals=list(w.seals))
+                    for w in player.workers
+                ]
+            )
+            players.append(new_player)
+        main_board_workers: defaultdict[str, list[tuple[int, int]]] = defaultdict(list)
+        for location_id, placements in self.main_board_workers.items():
+            main_board_workers[location_id] = list(placements)
+        clone = GameState(
+            players=players,
+            current_player_index=self.current_player_index,
+            round_number=self.round_number,
+            main_board_workers=main_board_workers,
+            academy_seals=list(self.academy_seals),
+            reserved_turn_order=dict(self.reserved_turn_order),
+        )
+        clone.current_player = players[self.current_player_index]
+        return clone
+
+
+# Seal colours used to fill the academy display row by row at setup.
+_ACADEMY_SETUP_CYCLE = [
+    SealColor.GREEN,
+    SealColor.BLUE,
+    SealColor.RED,
+    SealColor.YELLOW,
+]
+
+
+def create_initial_game_state(
+    all_game_data: AllGameData, num_players: int
+) -> GameState:
+    """Build a fresh GameState for ``num_players`` players."""
+    players = []
+    colors = list(PlayerColor)
+    for player_index in range(num_players):
+        workers = [
+            Worker.create(worker_id, row_index=worker_id)
+            for worker_id in range(STARTING_WORKERS)
+        ]
+        player = PlayerState(
+            player_index=player_index,
+            color=colors[player_index % len(colors)],
+        )
+        player.register_workers(workers)
+        players.append(player)
+    academy_seals: list[SealColor | None] = [
+        _ACADEMY_SETUP_CYCLE[(row_idx + col_idx) % 4]
+        for row_idx in range(ACADEMY_ROWS)
+        for col_idx in range(ACADEMY_COLS)
+    ]
+    game_state = GameState(players=players, academy_seals=academy_seals)
+    game_state.set_current_player(0)
+    logger.info("Created initial game state for %d players", num_players)
+    return game_state
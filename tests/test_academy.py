@@ -0,0 +1,25 @@
+"""Regression tests for the ACADEMY action."""
+
+import pytest
+
+from dj_engine.actions.academy import perform_academy_action
+from dj_engine.constants import SealColor
+from dj_engine.data_loader import load_all_data
+from dj_engine.exceptions import InvalidActionError
+from dj_engine.state import create_initial_game_state
+
+
+def test_academy_rejects_row_with_fewer_seal_slots_than_max_seals() -> None:
+    """A seal_slots list shorter than max_seals must not crash.
+
+    The shipped personal board defines worker row 0 with max_seals 1
+    but an empty seal_slots list, so the slot bound check has to fire
+    after the max_seals check passes.
+    """
+    data = load_all_data()
+    game_state = create_initial_game_state(data, num_players=2)
+    # Satisfy the location's wax seal requirement so the check under
+    # test is the one that fires.
+    game_state.players[0].workers_by_id[0].seals[SealColor.RED] += 1
+    with pytest.raises(InvalidActionError, match="no seal slot"):
+        perform_academy_action(game_state, data, 0, 0, "MAIN2_ACADEMY_1", 1, 0)
@@ -0,0 +1,14 @@
+"""Smoke test replacing the old top-level minimal_test.py shim."""
+
+from dj_engine.data_loader import SimpleActionInfo, TrackSpace
+
+
+def test_minimal_dataclass_construction() -> None:
+    space = TrackSpace(
+        id="TEST0",
+        actions=[SimpleActionInfo(type="GAIN_COINS", value=2)],
+        next=["TEST1"],
+    )
+    assert space.id == "TEST0"
+    assert space.actions[0].value == 2
+    assert not space.has_specimen